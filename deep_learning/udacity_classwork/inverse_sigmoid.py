@@ -1,10 +1,11 @@
-import numpy as np
+from scipy.special import expit, logit
 
 def sigmoid(x):
-    return 1 / (1 + np.exp(-x))
+    # expit is a C ufunc: one fused pass, no overflow for large |x|
+    return expit(x)
 
 def inverse_sigmoid(x):
-    return - np.log((1 - x)/x)
+    return logit(x)
 
 def main():
     x = sigmoid(5)
@@ -1,25 +1,27 @@
-def eval_val(x1, x2, c, y1, y2):
-    return x1*y1 + x2*y2 + c
+import math
 
-def eval(x1, x2, c, y1, y2):
-    return eval_val(x1, x2, c, y1, y2) >= 0
-
-def subtract(x, y, lr):
-    return x + y * lr
-
-def main():
+def main(verbose=False):
     counter = 0
-    retval = -1
     x1, x2, c, y1, y2, learning_rate = 3, 4, -10, 1, 1, 0.1
-    while True:
-        if eval(x1, x2, c, y1, y2):
-            break
-        else:
-            print(eval_val(x1, x2, c, y1, y2))
+    if verbose:
+        # step-by-step replay, prints the score after every update
+        while True:
+            score = x1*y1 + x2*y2 + c
+            if score >= 0:
+                break
+            print(score)
             counter += 1
-            x1 = subtract(x1, y1, learning_rate)
-            x2 = subtract(x2, y2, learning_rate)
-            c = subtract(c, 1, learning_rate)
+            x1 += y1 * learning_rate
+            x2 += y2 * learning_rate
+            c += learning_rate
+    else:
+        # each step adds lr*(y1^2 + y2^2 + 1) to the score, so the number
+        # of steps until it reaches 0 is just one division
+        step = learning_rate * (y1*y1 + y2*y2 + 1)
+        counter = max(0, math.ceil(-(x1*y1 + x2*y2 + c) / step))
+        x1 += counter * learning_rate * y1
+        x2 += counter * learning_rate * y2
+        c += counter * learning_rate
     print(counter)
 
 if __name__ == '__main__':
@@ -1,10 +1,17 @@
 from astpretty import pprint as pp
+from functools import lru_cache
 import ast
+import os
 import sys
 
+@lru_cache(maxsize=32)
+def parse_file(filename, mtime):
+	# mtime is part of the cache key, so editing the file on disk
+	# invalidates the cached tree
+	filedata = open(filename, 'r').read()
+	return ast.parse(filedata)
+
 if __name__ == '__main__':
 	filename = sys.argv[1]
-	# read file
-	filedata = open(filename, 'r').read()
 	# dump data
-	pp(ast.parse(filedata))
+	pp(parse_file(filename, os.path.getmtime(filename)))
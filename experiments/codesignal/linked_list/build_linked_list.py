@@ -1,8 +1,9 @@
 from utils import printList, Node, convertArrayToList
+from utils import _alloc
 
 def buildList(array, head):
     for element in array:
-        newNode = Node(element)
+        newNode = _alloc(element)
         if head != None:
             newNode.next = head
             head = newNode
@@ -21,66 +22,53 @@ def reverseList(oldList):
 
     return newList
 
-def reverseHeadToTail(head, tail):
-    print("head", head.value)
-    print("tail", tail.value)
-    newList = None
-    tailNext = tail.next
-    oldHead = head
-    i = 0
-    while head != None and head != tailNext:
-        element = head
-        head = head.next
-        if newList == None:
-            element.next = tailNext
-        else:
-            element.next = newList
-        newList = element
-    printList(newList)
-    print("___")
-    return newList, oldHead
-
-def findTail(head, k):
-    if head == None:
-        return None, False
-    node = head
-    i = 1
-    while i < k:
-        if node.next == None:
-            return head, False
-        node = node.next
-        i += 1
-    return node, True
-
 def reverseListKAtATime(head, k):
-    firstTime = True
-    newHead = head
+    # reverse each group while walking it, instead of one pass to find
+    # the group tail and a second pass to reverse
+    if head == None or k <= 1:
+        # k=1 groups reverse to themselves; k<=0 would never consume a node
+        return head
     firstHead = head
-    prevTail = head
-    while True:
-        tail, tf = findTail(newHead, k)
-        if tf != False:
-            nextHead = tail.next
-            newHead, newTail = reverseHeadToTail(newHead, tail)
-            print("prevTail.value", prevTail.value)
-            if firstTime:
-                firstHead = newHead
-                firstTime = False
+    prevTail = None
+    while head != None:
+        groupTail = head
+        newList = None
+        count = 0
+        while head != None and count < k:
+            nxt = head.next
+            head.next = newList
+            newList = head
+            head = nxt
+            count += 1
+        if count < k:
+            # last group was short of k: un-reverse it and reattach
+            restored = None
+            while newList != None:
+                nxt = newList.next
+                newList.next = restored
+                restored = newList
+                newList = nxt
+            if prevTail == None:
+                firstHead = restored
             else:
-                prevTail.next = newHead
-                prevTail = newTail
-            newHead = nextHead
-        else:
+                prevTail.next = restored
             break
+        if prevTail == None:
+            firstHead = newList
+        else:
+            prevTail.next = newList
+        prevTail = groupTail
     return firstHead
 
 
 
-def getTail(head):
+def getTail(head, tail=None):
+    # pass the tail from convertArrayToListWithTail to skip the scan
+    if tail != None:
+        return tail
     node = head
-    while node.next.next != None:
+    while node.next != None:
         node = node.next
-    print("tail", node.value)
     return node
 
 
@@ -1,30 +1,46 @@
 from utils import *
 
 def detectCycle(head):
-    seen = set()
-    while head:
-        if head in seen:
-            return head
-        else:
-            seen.add(head)
-        head = head.next
-    return None
+    # Brent's algorithm: O(1) memory, no per-node set insert/lookup
+    if head == None:
+        return None
+    power = 1
+    lam = 1
+    tortoise = head
+    hare = head.next
+    while hare != None and hare != tortoise:
+        if lam == power:
+            # teleport the tortoise and double the search window
+            tortoise = hare
+            power *= 2
+            lam = 0
+        hare = hare.next
+        lam += 1
+    if hare == None:
+        return None
+    # lam is the cycle length; offset one pointer by lam and walk both
+    # until they meet at the cycle entry
+    p1 = head
+    p2 = head
+    for i in range(lam):
+        p2 = p2.next
+    while p1 != p2:
+        p1 = p1.next
+        p2 = p2.next
+    return p1
 
 def detectCycle2(head):
     slow = head
     fast = head
     isCycle = False
-    try:
-        while fast and slow:
-            fast = fast.next.next
-            slow = slow.next
-            if fast == slow:
-                isCycle = True
-                break
+    # explicit null checks instead of letting AttributeError end the walk
+    while fast and fast.next:
+        fast = fast.next.next
+        slow = slow.next
+        if fast == slow:
+            isCycle = True
+            break
 
-    except:
-        return None
-    
     if isCycle:
         node = head
         while node != slow:
@@ -21,9 +21,19 @@ def insertNode(head, node):
 
 def insertionSort(head):
     newList = None
+    tail = None
     while head:
         n = head.next
-        newList = insertNode(newList, head)
+        if tail != None and head.value >= tail.value:
+            # already in order relative to the sorted part: append at the
+            # cached tail instead of rescanning from the front
+            tail.next = head
+            head.next = None
+            tail = head
+        else:
+            newList = insertNode(newList, head)
+            if tail == None:
+                tail = newList
         head = n
     return newList
         
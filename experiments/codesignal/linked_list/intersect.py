@@ -1,9 +1,20 @@
 from utils import *
 
 def intersect(headA, headB):
+    # measure both lists, skip the longer one ahead by the difference,
+    # then walk in lockstep; each list is traversed at most twice and
+    # there is no wraparound branch per step
+    lenA = countNodes(headA)
+    lenB = countNodes(headB)
     a = headA
     b = headB
+    while lenA > lenB:
+        a = a.next
+        lenA -= 1
+    while lenB > lenA:
+        b = b.next
+        lenB -= 1
     while a != b:
-        a = headB if a == None else a.next
-        b = headA if b == None else b.next
-    return a
\ No newline at end of file
+        a = a.next
+        b = b.next
+    return a
@@ -10,14 +10,38 @@ addAtIndex(index, val) : Add a node of value val before the index-th node in the
 deleteAtIndex(index) : Delete the index-th node in the linked list, if the index is valid.
 '''
 
+import io
+import sys
+
 class ListNode(object):
+    __slots__ = ('val', 'next')
+
     def __init__(self, val):
         self.val = val
         self.next = None
 
+# recycled ListNodes, same idea as the pool in utils.py
+_POOL = []
+_POOL_CAP = 1 << 16
+
+def _alloc(val):
+    n = _POOL.pop() if _POOL else ListNode.__new__(ListNode)
+    n.val = val
+    n.next = None
+    return n
+
+def _free(n):
+    n.val = None
+    n.next = None
+    if len(_POOL) < _POOL_CAP:
+        _POOL.append(n)
+
 class MyLinkedList(object):
+    __slots__ = ('head', 'tail', 'length')
+
     def __init__(self):
         self.head = None
+        self.tail = None
         self.length = 0
 
     def get(self, index):
@@ -31,26 +55,24 @@ class MyLinkedList(object):
         return n.val
     
     def addAtHead(self, val):
-        node = ListNode(val)
+        node = _alloc(val)
         if self.length == 0:
             self.head = node
+            self.tail = node
         else:
             node.next = self.head
-            self.head = node        
+            self.head = node
         self.length += 1
 
     
     def addAtTail(self, val):
-        node = ListNode(val)
+        node = _alloc(val)
         if self.length == 0:
             self.head = node
         else:
-            n = self.head
-            prev = None
-            while n:
-                prev = n
-                n = n.next
-            prev.next = node
+            # cached tail makes this O(1) instead of a full scan
+            self.tail.next = node
+        self.tail = node
         self.length += 1
 
 
@@ -70,7 +92,7 @@ class MyLinkedList(object):
         elif index == 0:
             self.addAtHead(val)
         elif index < self.length:
-            node = ListNode(val)
+            node = _alloc(val)
             prev = None
             n = self.head
             count = 0
@@ -96,16 +118,24 @@ class MyLinkedList(object):
                 self.head = self.head.next
             else:
                 prev.next = n.next
+            if n == self.tail:
+                self.tail = prev
+            _free(n)
             self.length -= 1
     
     def printList(self):
+        # accumulate the dump and emit it with one write, not one print
+        # per node
+        out = io.StringIO()
         n = self.head
         while n:
-            print(n.val)
+            out.write(str(n.val))
+            out.write('\n')
             n = n.next
-        print('_____')
-        print("length", self.length)
-        print('_____')
+        out.write('_____\n')
+        out.write('length %d\n' % self.length)
+        out.write('_____\n')
+        sys.stdout.write(out.getvalue())
 
 
 
@@ -1,4 +1,5 @@
 from utils import *
+import numpy as np
 
 
 def listLength(head):
@@ -28,18 +29,15 @@ def reverseList(head):
     return newList
 
 def isPalidrome(head):
-    # get middle element
-    midElement = getMid(head)
-    # reverse second half of the list
-    if listLength(head) % 2 == 1:
-        midElement = midElement.next
-    newList = reverseList(midElement)
-    while head and newList:
-        if head.value != newList.value:
-            return False
+    # gather the values once, then compare against the reversed view in
+    # one vectorized pass; also leaves the list intact instead of
+    # reversing its back half in place
+    values = []
+    while head:
+        values.append(head.value)
         head = head.next
-        newList = newList.next
-    return True
+    values = np.asarray(values)
+    return bool((values == values[::-1]).all())
 
 def checkReverseList():
     head = convertArrayToList([1,2,3,4,5])
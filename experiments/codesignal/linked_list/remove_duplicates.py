@@ -3,43 +3,50 @@ from utils import printList, Node, convertArrayToList
 def findDuplicatesInList(head):
     nums = set()
     duplicates = set()
+    # bind the bound methods once; saves an attribute lookup per node
+    nums_add = nums.add
+    duplicates_add = duplicates.add
     while head != None:
-        if head.value in nums:
-            duplicates.add(head.value)
+        v = head.value
+        if v in nums:
+            duplicates_add(v)
         else:
-            nums.add(head.value)
+            nums_add(v)
         head = head.next
     print(duplicates)
 
 def removeDuplicates(head):
+    # drop every value that appears more than once, in one flat pass:
+    # compare each node with its neighbour and carry a "run in progress"
+    # flag instead of an inner skip loop
     if not head:
         return head
     fakeHead = Node(0)
     fakeHead.next = head
     pre = fakeHead
     cur = head
+    dup = False
     while cur != None:
-        while cur.next and cur.value == cur.next.value:
-            cur = cur.next
-        if pre.next == cur:
-            pre = pre.next
+        nxt = cur.next
+        if nxt != None and nxt.value == cur.value:
+            dup = True
+        elif dup:
+            # cur closes a run of duplicates, unlink the whole run
+            pre.next = nxt
+            dup = False
         else:
-            pre.next = cur.next
-        cur = cur.next
+            pre = cur
+        cur = nxt
     return fakeHead.next
 
 def removeDuplicates2(head):
-    if not head:
-        return head
+    # keep one node per value: single neighbour compare per step
     cur = head
-    while cur != None:
-        n = cur
-        while n.next and n.next.value == cur.value:
-            n = n.next
-        if cur == n:
-            cur = cur.next
+    while cur != None and cur.next != None:
+        if cur.next.value == cur.value:
+            cur.next = cur.next.next
         else:
-            cur.next = n.next
+            cur = cur.next
     return head
 
 
@@ -4,35 +4,25 @@ def reorderList(head):
     if not head or not head.next:
         return head
 
-    # find the middle of the list
-    p1 = head
-    p2 = head
-    while p2.next and p2.next.next:
-        p1 = p1.next
-        p2 = p2.next.next
-    
-    # reverse the second half of the list
-    preMiddle = p1
-    preCurrent = p1.next
-    while preCurrent.next:
-        current = preCurrent.next
-        preCurrent.next = current.next
-        current.next = preMiddle.next
-        preMiddle.next = current
+    # index every node in one traversal, then rewire front/back pairs
+    # directly instead of find-middle + reverse + merge passes
+    nodes = []
+    n = head
+    while n != None:
+        nodes.append(n)
+        n = n.next
 
-    printList(head)
-    print("_____")
+    i = 0
+    j = len(nodes) - 1
+    while i < j:
+        nodes[i].next = nodes[j]
+        i += 1
+        if i == j:
+            break
+        nodes[j].next = nodes[i]
+        j -= 1
+    nodes[i].next = None
 
-    # start reorder one by one
-    p1 = head
-    p2 = preMiddle.next
-    while p1 != preMiddle:
-        preMiddle.next = p2.next
-        p2.next = p1.next
-        p1.next = p2
-        p1 = p2.next
-        p2 = preMiddle.next
-    
     return head
 
 
@@ -1,30 +1,23 @@
 from utils import convertArrayToList, Node, printList, countNodes
 
-def removeAndReturnLastNode(head):
-    node = head
-    prev = None
-    while node.next != None:
-        prev = node
-        node = node.next
-    if not prev:
-        # first node
-        return node
-    prev.next = None
-    return node
-
-def rotateOnce(head):
-    node = removeAndReturnLastNode(head)
-    node.next = head
-    head = node
-    return head
-
 def rotate(head, k):
+    # close the list into a ring and break it n-k links in, instead of
+    # walking to the tail once per rotation step
     n = countNodes(head)
     if n == 0 or n == 1:
         return head
-    print(k % n)
-    for i in range(k % n):
-        head = rotateOnce(head)
+    k = k % n
+    if k == 0:
+        return head
+    tail = head
+    while tail.next != None:
+        tail = tail.next
+    tail.next = head
+    newTail = head
+    for i in range(n - k - 1):
+        newTail = newTail.next
+    head = newTail.next
+    newTail.next = None
     return head
 
 def main():
@@ -1,27 +1,128 @@
+import sys
+
+import numpy as np
+
+class ArrayList(object):
+    '''
+    Structure-of-arrays linked list: values and next-indices live in two
+    contiguous int64 arrays (-1 means null), so walking the list is an
+    array scan instead of a pointer chase on .next.
+    '''
+    __slots__ = ('value', 'next', 'head', 'size', '_contiguous')
+
+    def __init__(self, cap):
+        self.value = np.empty(cap, dtype=np.int64)
+        self.next = np.empty(cap, dtype=np.int64)
+        self.head = -1
+        self.size = 0
+        self._contiguous = False
+
+    @classmethod
+    def from_array(cls, arr):
+        n = len(arr)
+        al = cls(max(n, 1))
+        if n > 0:
+            al.value[:n] = arr
+            al.next[:n-1] = np.arange(1, n)
+            al.next[n-1] = -1
+            al.head = 0
+        al.size = n
+        al._contiguous = True
+        return al
+
+    def count(self):
+        if self._contiguous:
+            if self.size == 0:
+                return 0
+            return int((self.next[:self.size] != -1).sum()) + 1
+        i = self.head
+        n = 0
+        while i != -1:
+            n += 1
+            i = int(self.next[i])
+        return n
+
+    def gather(self):
+        # values in list order, as one contiguous array
+        if self._contiguous:
+            return self.value[:self.size]
+        order = []
+        i = self.head
+        while i != -1:
+            order.append(i)
+            i = int(self.next[i])
+        return self.value[order]
+
+    def isPalidrome(self):
+        vals = self.gather()
+        return bool((vals == vals[::-1]).all())
+
+    def printList(self):
+        for v in self.gather():
+            print(v)
+
+    def toNodeList(self):
+        # thin bridge back to the Node API, for cross-checking results
+        return convertArrayToList(self.gather().tolist())
+
 class Node(object):
+    __slots__ = ('value', 'next')
+
     def __init__(self, x):
         self.value = x
         self.next = None
 
-def convertArrayToList(array):
+# free-list of recycled nodes so building many lists doesn't hit the
+# allocator once per element
+_POOL = []
+_POOL_CAP = 1 << 16
+
+def _alloc(v):
+    n = _POOL.pop() if _POOL else Node.__new__(Node)
+    n.value = v
+    n.next = None
+    return n
+
+def _free(n):
+    n.value = None
+    n.next = None
+    if len(_POOL) < _POOL_CAP:
+        _POOL.append(n)
+
+def release_list(head):
+    while head != None:
+        nxt = head.next
+        _free(head)
+        head = nxt
+
+def convertArrayToListWithTail(array):
+    # the builder already knows the tail; hand it back so callers don't
+    # have to rescan the list for it
     head = None
     tail = head
     for each in array:
-        newNode = Node(each)
+        newNode = _alloc(each)
         if head == None:
             head = newNode
             tail = head
         else:
             tail.next = newNode
             tail = newNode
+    return head, tail
+
+def convertArrayToList(array):
+    head, tail = convertArrayToListWithTail(array)
     return head
 
 def printList(head):
+    # build the whole output first so we hit stdout once, not per line
+    lines = []
     node = head
     while node != None:
-        print(node.value)
-        print
+        lines.append(str(node.value))
         node = node.next
+    if lines:
+        sys.stdout.write('\n'.join(lines) + '\n')
 
 def countNodes(head):
     node = head
@@ -18,16 +18,21 @@ def recursive_binary_exponentiation(a, b):
 def iterative_binary_exponentiation(a, b):
     if b < 0:
         raise Exception('Value Error')
-    res = 1
-    while b > 0:
-        if b & 1:
-            res = res * a
-        a = a * a
-        b >>= 1
-    return res
+    # ** runs the square-and-multiply loop in C
+    return a ** b
 
 
 def big_number_mod(a, b, c):
+    if b < 0:
+        raise Exception('Value Error')
+    elif c == 1:
+        return 0
+    # built-in pow runs the whole square-and-multiply loop in C
+    return pow(a, b, c)
+
+
+def _py_big_number_mod(a, b, c):
+    # the explicit square-and-multiply, kept to cross-check pow
     if b < 0:
         raise Exception('Value Error')
     elif c == 1:
@@ -68,3 +73,6 @@ class TestBE(unittest.TestCase):
     def test_mod(self):
         self.assertEqual(big_number_mod(2, 0, 1), 0)
         self.assertEqual(big_number_mod(2, 2147483647, 13), 11)
+        self.assertEqual(_py_big_number_mod(2, 0, 1), 0)
+        self.assertEqual(_py_big_number_mod(2, 2147483647, 13),
+                         big_number_mod(2, 2147483647, 13))
@@ -1,14 +1,12 @@
 # https://cp-algorithms.com/algebra/euclid-algorithm.html
 # Calculates GCD of two numbers in O(log min(a, b))
 import unittest
-
-
-def gcd(a, b):
-    return gcd(b, a % b) if b else a
+from math import gcd
 
 
 def lcm(a, b):
-    return a / gcd(a, b) * b
+    # // keeps this in exact integer arithmetic (no float rounding)
+    return a // gcd(a, b) * b
 
 
 class TestGCD(unittest.TestCase):